@@ -5,10 +5,11 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 import json
+import os
+import hashlib
+from pyarrow import csv as pa_csv
 from datetime import datetime
 import seaborn as sns
-import warnings
-warnings.filterwarnings('ignore')
 
 from data_processor import DataProcessor
 from visualizations import MovieVisualizations
@@ -61,9 +62,56 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+CACHE_DIR = 'cache'
+LIST_COLUMNS = ['genre_list', 'main_cast']
+CATEGORY_COLUMNS = ['rating_category', 'runtime_category', 'budget_category']
+MOVIE_COLUMNS = [
+    'id', 'movie_id', 'title', 'release_date', 'runtime', 'vote_average', 'vote_count',
+    'revenue', 'budget', 'popularity', 'genres', 'overview', 'tagline', 'keywords'
+]
+CREDIT_COLUMNS = ['id', 'movie_id', 'cast', 'crew']
+
+def _read_csv_columns(path, columns):
+    """Read only the wanted columns of a CSV with the multithreaded pyarrow reader"""
+    # include_columns rejects names missing from the file, so match against the header first
+    header = pd.read_csv(path, nrows=0).columns
+    convert_options = pa_csv.ConvertOptions(include_columns=[col for col in header if col in columns])
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+    # Dates convert straight to datetime64 instead of per-row Python date objects
+    return table.to_pandas(date_as_object=False, coerce_temporal_nanoseconds=True)
+
+def _cache_path(movies_path, credits_path):
+    """Build the Parquet cache path keyed by the input files and the loading and processing code"""
+    key_parts = []
+    for path in (movies_path, credits_path, __file__, 'data_processor.py'):
+        if os.path.exists(path):
+            key_parts.append(f"{os.path.getmtime(path)}{os.path.getsize(path)}")
+    key = hashlib.md5(''.join(key_parts).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.parquet")
+
+def _read_cached(path):
+    """Read a processed DataFrame from the Parquet cache"""
+    df = pd.read_parquet(path, engine='pyarrow')
+    # Parquet list columns come back as numpy arrays; restore plain lists
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = [list(values) for values in df[col]]
+    return df
+
+def _write_cached(df, path):
+    """Write a processed DataFrame to the Parquet cache, ignoring write failures"""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, engine='pyarrow', compression='zstd')
+    except OSError:
+        pass
+
+@st.cache_resource
 def load_data():
-    """Load and process movie data"""
+    """Load and process movie data (shared read-only across sessions)"""
     try:
         # Try different file paths for deployment vs local
         file_paths = [
@@ -72,27 +120,55 @@ def load_data():
             ('data/tmdb_5000_movies.csv', 'data/tmdb_5000_credits.csv')
         ]
         
-        movies_df = None
-        credits_df = None
-        
         for movies_path, credits_path in file_paths:
-            try:
-                movies_df = pd.read_csv(movies_path)
-                credits_df = pd.read_csv(credits_path)
+            if os.path.exists(movies_path) and os.path.exists(credits_path):
                 break
-            except FileNotFoundError:
-                continue
-        
-        if movies_df is None or credits_df is None:
+        else:
             st.error("Dataset files not found. Please ensure the TMDB dataset files are uploaded to your repository.")
             return None
         
+        # Reuse the processed data from a previous run if the inputs are unchanged
+        cache_path = _cache_path(movies_path, credits_path)
+        if os.path.exists(cache_path):
+            return _read_cached(cache_path)
+        
+        movies_df = _read_csv_columns(movies_path, MOVIE_COLUMNS)
+        credits_df = _read_csv_columns(credits_path, CREDIT_COLUMNS)
+        
         processor = DataProcessor()
-        return processor.process_data(movies_df, credits_df)
+        df = processor.process_data(movies_df, credits_df)
+        _write_cached(df, cache_path)
+        return df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None
 
+@st.cache_resource
+def load_helpers():
+    """Build the visualization and utility helpers once for the shared dataset"""
+    df = load_data()
+    return MovieVisualizations(df), MovieUtils(df)
+
+def compute_aggregates(df, filtered_df, utils):
+    """Compute summary metrics and top-movie tables for the current filter selection"""
+    def nanmean(values):
+        return np.nanmean(values) if len(values) else np.nan
+    
+    vote_average = filtered_df['vote_average'].to_numpy()
+    revenue = filtered_df['revenue'].to_numpy()
+    runtime = filtered_df['runtime'].to_numpy()
+    
+    return {
+        'avg_rating': nanmean(vote_average),
+        'total_revenue': np.nansum(revenue),
+        'avg_runtime': nanmean(runtime),
+        'overall_avg_rating': nanmean(df['vote_average'].to_numpy()),
+        'overall_total_revenue': np.nansum(df['revenue'].to_numpy()),
+        'overall_avg_runtime': nanmean(df['runtime'].to_numpy()),
+        'top_rated': utils.get_top_rated_movies(filtered_df, 15),
+        'top_grossing': utils.get_top_grossing_movies(filtered_df, 10)
+    }
+
 def main():
     try:
         # Header
@@ -108,9 +184,8 @@ def main():
         st.error(f"Application startup error: {str(e)}")
         st.stop()
     
-    # Initialize visualization class
-    viz = MovieVisualizations(df)
-    utils = MovieUtils(df)
+    # Initialize visualization and utility classes
+    viz, utils = load_helpers()
     
     # Sidebar filters
     st.sidebar.markdown('<div class="section-header">🔍 Data Filters</div>', unsafe_allow_html=True)
@@ -136,11 +211,12 @@ def main():
     )
     
     # Runtime filter
+    max_runtime = int(df['runtime'].max())
     runtime_range = st.sidebar.slider(
         "Runtime (minutes)",
         min_value=0,
-        max_value=int(df['runtime'].max()),
-        value=(0, int(df['runtime'].max())),
+        max_value=max_runtime,
+        value=(0, max_runtime),
         step=5
     )
     
@@ -155,16 +231,13 @@ def main():
     # Apply filters
     filtered_df = utils.filter_data(df, year_range, rating_range, runtime_range, selected_genres)
     
+    aggregates = compute_aggregates(df, filtered_df, utils)
+    
     # Display filter summary
     st.sidebar.markdown("---")
     st.sidebar.metric("Total Movies", len(filtered_df))
-    
-    # Handle missing columns gracefully
-    if 'vote_average' in filtered_df.columns:
-        st.sidebar.metric("Average Rating", f"{filtered_df['vote_average'].mean():.2f}")
-    
-    if 'revenue' in filtered_df.columns:
-        st.sidebar.metric("Total Revenue", f"${filtered_df['revenue'].sum():,.0f}")
+    st.sidebar.metric("Average Rating", f"{aggregates['avg_rating']:.2f}")
+    st.sidebar.metric("Total Revenue", f"${aggregates['total_revenue']:,.0f}")
     
     # Main dashboard content
     if len(filtered_df) == 0:
@@ -182,27 +255,27 @@ def main():
         )
     
     with col2:
-        avg_rating = filtered_df['vote_average'].mean()
+        avg_rating = aggregates['avg_rating']
         st.metric(
             "Average Rating",
             f"{avg_rating:.2f}",
-            delta=f"{avg_rating - df['vote_average'].mean():.2f}"
+            delta=f"{avg_rating - aggregates['overall_avg_rating']:.2f}"
         )
     
     with col3:
-        total_revenue = filtered_df['revenue'].sum()
+        total_revenue = aggregates['total_revenue']
         st.metric(
             "Total Revenue",
             f"${total_revenue/1e9:.1f}B",
-            delta=f"${(total_revenue - df['revenue'].sum())/1e9:.1f}B"
+            delta=f"${(total_revenue - aggregates['overall_total_revenue'])/1e9:.1f}B"
         )
     
     with col4:
-        avg_runtime = filtered_df['runtime'].mean()
+        avg_runtime = aggregates['avg_runtime']
         st.metric(
             "Avg Runtime",
             f"{avg_runtime:.0f} min",
-            delta=f"{avg_runtime - df['runtime'].mean():.0f} min"
+            delta=f"{avg_runtime - aggregates['overall_avg_runtime']:.0f} min"
         )
     
     st.markdown("---")
@@ -252,22 +325,11 @@ def main():
             # Average rating by genre (text display)
             st.subheader("📊 Average Rating by Genre")
             if 'genre_list' in filtered_df.columns:
-                # Expand genres for analysis
-                genre_data = []
-                for _, row in filtered_df.iterrows():
-                    for genre in row['genre_list']:
-                        genre_data.append({
-                            'genre': genre,
-                            'vote_average': row['vote_average'],
-                            'vote_count': row['vote_count']
-                        })
+                genre_df = utils.get_genres_long(filtered_df)
                 
-                if genre_data:
-                    import pandas as pd
-                    genre_df = pd.DataFrame(genre_data)
-                    
+                if len(genre_df) > 0:
                     # Calculate weighted average ratings
-                    genre_ratings = genre_df.groupby('genre').agg({
+                    genre_ratings = genre_df.groupby('genre', observed=True).agg({
                         'vote_average': 'mean',
                         'vote_count': 'sum'
                     }).reset_index()
@@ -316,7 +378,7 @@ def main():
         
         # Top rated movies
         st.subheader("⭐ Highest Rated Movies")
-        top_rated = utils.get_top_rated_movies(filtered_df, 15)
+        top_rated = aggregates['top_rated']
         
         # Display movies with ratings in a clean format
         for i, row in top_rated.head(10).iterrows():
@@ -364,7 +426,7 @@ def main():
         
         # Top grossing movies
         st.subheader("💰 Top Grossing Movies")
-        top_grossing = utils.get_top_grossing_movies(filtered_df, 10)
+        top_grossing = aggregates['top_grossing']
         
         if len(top_grossing) > 0:
             fig_grossing = viz.plot_top_movies_bar(top_grossing, 'revenue', 'Top Grossing Movies')
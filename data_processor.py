@@ -2,8 +2,42 @@ import pandas as pd
 import numpy as np
 import json
 import ast
+import orjson
 from datetime import datetime
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# numexpr's fused, multithreaded evaluation only pays off on large catalogs
+NUMEXPR_MIN_ROWS = 100_000
+
+
+def _parse_json_list(value):
+    """Parse a TMDB JSON list column value into a list of dicts"""
+    if not isinstance(value, str) or value == '':
+        return []
+    try:
+        # TMDB exports are valid JSON, so the C parser handles almost every row
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # Fall back for rows stored as Python literals (single-quoted dicts)
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def _bin_categorical(values, bins, labels):
+    """Bin values into right-inclusive intervals like pd.cut, using integer codes"""
+    codes = np.searchsorted(bins, values, side='left') - 1
+    # Values outside (bins[0], bins[-1]] and NaN get the missing code
+    codes[(codes < 0) | (codes >= len(labels))] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
 class DataProcessor:
     """Class to handle data loading and preprocessing"""
     
@@ -20,8 +54,10 @@ class DataProcessor:
         if 'id' in credits_df.columns and 'movie_id' not in credits_df.columns:
             credits_df = credits_df.rename(columns={'id': 'movie_id'})
         
-        # Merge datasets on movie_id
-        df = movies_df.merge(credits_df, on='movie_id', how='inner')
+        # Join datasets on movie_id as an index-aligned join
+        df = movies_df.set_index('movie_id').join(
+            credits_df.set_index('movie_id'), how='inner', lsuffix='_x', rsuffix='_y'
+        ).reset_index()
         
         # Handle title columns - movies dataset has 'title', credits has 'title' too
         # Keep the title from movies dataset and remove the one from credits if it exists
@@ -70,6 +106,9 @@ class DataProcessor:
         # Filter out invalid data
         df = self._filter_invalid_data(df)
         
+        # Downcast only once the values are known to be in range
+        df = self._downcast_columns(df)
+        
         return df
     
     def _handle_missing_values(self, df):
@@ -98,108 +137,152 @@ class DataProcessor:
         if 'genres' not in df.columns:
             return df
         
-        def extract_genres(genre_str):
+        genre_lists = []
+        primary_genres = []
+        genre_counts = []
+        for value in df['genres'].to_numpy():
             try:
-                if pd.isna(genre_str) or genre_str == '':
-                    return []
-                
-                # Parse JSON string
-                genres = ast.literal_eval(genre_str)
-                return [genre['name'] for genre in genres]
-            except:
-                return []
-        
-        df['genre_list'] = df['genres'].apply(extract_genres)
-        df['primary_genre'] = df['genre_list'].apply(lambda x: x[0] if x else 'Unknown')
-        df['genre_count'] = df['genre_list'].apply(len)
+                genres = [genre['name'] for genre in _parse_json_list(value)]
+            except (KeyError, TypeError):
+                genres = []
+            genre_lists.append(genres)
+            primary_genres.append(genres[0] if genres else 'Unknown')
+            genre_counts.append(len(genres))
+        
+        df['genre_list'] = genre_lists
+        df['primary_genre'] = primary_genres
+        df['genre_count'] = genre_counts
         
         return df
     
     def _process_cast(self, df):
         """Process cast column"""
-        def extract_main_cast(cast_str, num_actors=5):
+        num_actors = 5
+        main_cast = []
+        for value in df['cast'].to_numpy():
             try:
-                if pd.isna(cast_str) or cast_str == '':
-                    return []
-                
-                cast = ast.literal_eval(cast_str)
-                return [actor['name'] for actor in cast[:num_actors]]
-            except:
-                return []
+                main_cast.append([actor['name'] for actor in _parse_json_list(value)[:num_actors]])
+            except (KeyError, TypeError):
+                main_cast.append([])
         
-        df['main_cast'] = df['cast'].apply(extract_main_cast)
-        df['cast_size'] = df['main_cast'].apply(len)
+        df['main_cast'] = main_cast
+        df['cast_size'] = [len(actors) for actors in main_cast]
         
         return df
     
     def _process_crew(self, df):
         """Process crew column to extract director"""
         def extract_director(crew_str):
-            try:
-                if pd.isna(crew_str) or crew_str == '':
-                    return 'Unknown'
-                
-                crew = ast.literal_eval(crew_str)
-                for person in crew:
-                    if person.get('job') == 'Director':
+            # Parse only the first director entry instead of the whole crew list
+            if isinstance(crew_str, str):
+                pos = crew_str.find('"job": "Director"')
+                if pos != -1:
+                    start = crew_str.rfind('{', 0, pos)
+                    end = crew_str.find('}', pos)
+                    try:
+                        return orjson.loads(crew_str[start:end + 1])['name']
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        pass
+            
+            for person in _parse_json_list(crew_str):
+                try:
+                    if person['job'] == 'Director':
                         return person['name']
-                return 'Unknown'
-            except:
-                return 'Unknown'
+                except (KeyError, TypeError):
+                    continue
+            return 'Unknown'
         
-        df['director'] = df['crew'].apply(extract_director)
+        df['director'] = [extract_director(value) for value in df['crew'].to_numpy()]
         
         return df
     
     def _calculate_metrics(self, df):
         """Calculate additional metrics"""
         
-        # Profit calculation
-        df['profit'] = df['revenue'] - df['budget']
+        revenue = df['revenue'].to_numpy()
+        budget = df['budget'].to_numpy()
+        vote_average = df['vote_average'].to_numpy()
         
-        # ROI calculation (avoid division by zero)
-        df['roi'] = np.where(df['budget'] > 0, (df['profit'] / df['budget']) * 100, 0)
-        
-        # Success score (combination of rating and popularity)
-        df['success_score'] = (df['vote_average'] * 0.7) + (np.log1p(df['popularity']) * 0.3)
+        # Profit calculation
+        profit = revenue - budget
+        df['profit'] = profit
+        
+        popularity = df['popularity'].to_numpy()
+        
+        if ne is not None and len(df) >= NUMEXPR_MIN_ROWS:
+            arrays = {
+                'r': revenue.astype(np.float64, copy=False),
+                'b': budget.astype(np.float64, copy=False),
+                'va': vote_average,
+                'pop': popularity
+            }
+            df['roi'] = ne.evaluate("where(b > 0, (r - b) / b * 100, 0)", local_dict=arrays)
+            df['success_score'] = ne.evaluate("va * 0.7 + log1p(pop) * 0.3", local_dict=arrays)
+        else:
+            # ROI calculation (avoid division by zero)
+            roi = np.zeros(len(df))
+            np.divide(profit * 100, budget, out=roi, where=budget > 0)
+            df['roi'] = roi
+            
+            # Success score (combination of rating and popularity)
+            df['success_score'] = (vote_average * 0.7) + (np.log1p(popularity) * 0.3)
         
         # Rating category
-        df['rating_category'] = pd.cut(
-            df['vote_average'], 
-            bins=[0, 4, 6, 8, 10], 
+        df['rating_category'] = _bin_categorical(
+            vote_average,
+            bins=[0, 4, 6, 8, 10],
             labels=['Poor', 'Average', 'Good', 'Excellent']
         )
         
         # Runtime category
-        df['runtime_category'] = pd.cut(
-            df['runtime'], 
-            bins=[0, 90, 120, 180, float('inf')], 
+        df['runtime_category'] = _bin_categorical(
+            df['runtime'].to_numpy(),
+            bins=[0, 90, 120, 180, np.inf],
             labels=['Short', 'Medium', 'Long', 'Epic']
         )
         
         # Budget category
-        df['budget_category'] = pd.cut(
-            df['budget'], 
-            bins=[0, 1e6, 10e6, 50e6, float('inf')], 
+        df['budget_category'] = _bin_categorical(
+            budget,
+            bins=[0, 1e6, 10e6, 50e6, np.inf],
             labels=['Low', 'Medium', 'High', 'Blockbuster']
         )
         
+        # Store repeated labels as categoricals so groupby works on integer codes
+        for col in ('primary_genre', 'director', 'rating_category', 'runtime_category', 'budget_category'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
         return df
     
     def _filter_invalid_data(self, df):
         """Filter out invalid or unrealistic data"""
         
-        # Remove movies with invalid years
         current_year = datetime.now().year
-        df = df[(df['release_year'] >= 1900) & (df['release_year'] <= current_year)]
-        
-        # Remove movies with unrealistic runtime
-        df = df[(df['runtime'] >= 10) & (df['runtime'] <= 500)]
-        
-        # Remove movies with invalid ratings
-        df = df[(df['vote_average'] >= 0) & (df['vote_average'] <= 10)]
+        year = df['release_year'].to_numpy()
+        runtime = df['runtime'].to_numpy()
+        rating = df['vote_average'].to_numpy()
+        
+        # Remove movies with invalid years, unrealistic runtime or invalid ratings
+        mask = (
+            (year >= 1900) & (year <= current_year) &
+            (runtime >= 10) & (runtime <= 500) &
+            (rating >= 0) & (rating <= 10)
+        )
+        df = df.iloc[mask]
         
         # Reset index
         df = df.reset_index(drop=True)
         
         return df
+    
+    def _downcast_columns(self, df):
+        """Downcast whole-number columns, keeping any whose values would not fit"""
+        
+        for col, dtype in (('release_year', 'int16'), ('runtime', 'int16'), ('vote_count', 'int32')):
+            values = df[col].round()
+            limits = np.iinfo(dtype)
+            if values.empty or (values.min() >= limits.min and values.max() <= limits.max):
+                df[col] = values.astype(dtype)
+        
+        return df
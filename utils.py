@@ -7,51 +7,95 @@ class MovieUtils:
     
     def __init__(self, df):
         self.df = df
+        self._genre_vocab, self._genre_matrix = self._build_genre_matrix(df)
+        self._genre_counter = self._count_genres(df)
+        self.genres_long = self._build_genres_long(df)
+        self._lowered = {
+            col: self._lowercase_array(df[col])
+            for col in ('title', 'director') if col in df.columns
+        }
     
-    def get_all_genres(self):
-        """Get all unique genres from the dataset"""
-        if 'genre_list' not in self.df.columns:
-            return []
+    def _lowercase_array(self, series):
+        """Lowercased fixed-width string array for vectorized substring search"""
+        return series.astype(object).fillna('').astype(str).str.lower().to_numpy(dtype=str)
+    
+    def _contains_mask(self, df, col, query):
+        """Case-insensitive substring match of query against a text column"""
+        if df is self.df and col in self._lowered:
+            values = self._lowered[col]
+        else:
+            values = self._lowercase_array(df[col])
+        return np.char.find(values, query.lower()) >= 0
+    
+    def _build_genre_matrix(self, df):
+        """Build a movies x genres boolean membership matrix"""
+        if 'genre_list' not in df.columns:
+            return {}, np.zeros((len(df), 0), dtype=bool)
         
-        all_genres = []
-        for genres in self.df['genre_list']:
-            if isinstance(genres, list):
-                all_genres.extend(genres)
+        genre_lists = [genres if isinstance(genres, list) else [] for genres in df['genre_list']]
+        vocab = {genre: i for i, genre in enumerate(sorted({g for genres in genre_lists for g in genres}))}
         
-        return sorted(list(set(all_genres)))
+        rows = np.repeat(np.arange(len(genre_lists)), [len(genres) for genres in genre_lists])
+        cols = np.fromiter((vocab[g] for genres in genre_lists for g in genres), dtype=np.intp, count=len(rows))
+        matrix = np.zeros((len(genre_lists), len(vocab)), dtype=bool)
+        matrix[rows, cols] = True
+        
+        return vocab, matrix
+    
+    def _genre_mask(self, df, selected_genres):
+        """Boolean mask of rows in df having any of the selected genres"""
+        if df is self.df:
+            vocab, matrix = self._genre_vocab, self._genre_matrix
+        else:
+            vocab, matrix = self._build_genre_matrix(df)
+        
+        selected_idx = [vocab[genre] for genre in selected_genres if genre in vocab]
+        return matrix[:, selected_idx].any(axis=1)
+    
+    def _build_genres_long(self, df):
+        """Build a long-form frame with one row per (movie, genre) pair"""
+        if 'genre_list' not in df.columns:
+            return pd.DataFrame(columns=['movie_id', 'genre'])
+        
+        metric_columns = [col for col in ('movie_id', 'vote_average', 'vote_count', 'revenue', 'release_year') if col in df.columns]
+        genres_long = df[metric_columns].join(df['genre_list'].explode().rename('genre'))
+        genres_long = genres_long.dropna(subset=['genre'])
+        genres_long['genre'] = genres_long['genre'].astype('category')
+        
+        return genres_long
+    
+    def get_genres_long(self, df):
+        """Get the long-form genre rows for the movies in df"""
+        if df is self.df:
+            return self.genres_long
+        if 'movie_id' not in df.columns:
+            # No key to select precomputed rows by, so build them from df itself
+            return self._build_genres_long(df)
+        
+        return self.genres_long[self.genres_long['movie_id'].isin(df['movie_id'].to_numpy())]
+    
+    def get_all_genres(self):
+        """Get all unique genres from the dataset"""
+        return list(self._genre_vocab)
     
     def filter_data(self, df, year_range, rating_range, runtime_range, selected_genres):
         """Filter dataframe based on user selections"""
-        filtered_df = df.copy()
-        
-        # Year filter
-        filtered_df = filtered_df[
-            (filtered_df['release_year'] >= year_range[0]) & 
-            (filtered_df['release_year'] <= year_range[1])
-        ]
-        
-        # Rating filter
-        filtered_df = filtered_df[
-            (filtered_df['vote_average'] >= rating_range[0]) & 
-            (filtered_df['vote_average'] <= rating_range[1])
-        ]
-        
-        # Runtime filter
-        filtered_df = filtered_df[
-            (filtered_df['runtime'] >= runtime_range[0]) & 
-            (filtered_df['runtime'] <= runtime_range[1])
-        ]
+        year = df['release_year'].to_numpy()
+        rating = df['vote_average'].to_numpy()
+        runtime = df['runtime'].to_numpy()
+        
+        # Year, rating and runtime filters combined into a single mask
+        mask = (
+            (year >= year_range[0]) & (year <= year_range[1]) &
+            (rating >= rating_range[0]) & (rating <= rating_range[1]) &
+            (runtime >= runtime_range[0]) & (runtime <= runtime_range[1])
+        )
         
         # Genre filter
-        if selected_genres and 'genre_list' in filtered_df.columns:
-            def has_selected_genre(genres):
-                if not isinstance(genres, list):
-                    return False
-                return any(genre in selected_genres for genre in genres)
-            
-            filtered_df = filtered_df[filtered_df['genre_list'].apply(has_selected_genre)]
+        if selected_genres and 'genre_list' in df.columns:
+            mask &= self._genre_mask(df, selected_genres)
         
-        return filtered_df
+        return df.iloc[mask]
     
     def get_top_rated_movies(self, df, n=10):
         """Get top rated movies with minimum vote count"""
@@ -100,38 +144,41 @@ class MovieUtils:
         
         return stats
     
+    def _count_genres(self, df):
+        """Count genre occurrences across the dataset"""
+        if 'genre_list' not in df.columns:
+            return Counter()
+        
+        return Counter(g for genres in df['genre_list'] if isinstance(genres, list) for g in genres)
+    
     def _get_most_common_genre(self, df):
         """Get the most common genre in the dataset"""
         if 'genre_list' not in df.columns:
             return 'Unknown'
         
-        all_genres = []
-        for genres in df['genre_list']:
-            if isinstance(genres, list):
-                all_genres.extend(genres)
-        
-        if not all_genres:
+        counter = self._genre_counter if df is self.df else self._count_genres(df)
+        if not counter:
             return 'Unknown'
         
-        return Counter(all_genres).most_common(1)[0][0]
+        return counter.most_common(1)[0][0]
     
     def search_movies(self, df, query):
         """Search movies by title"""
-        return df[df['title'].str.contains(query, case=False, na=False)]
+        return df.iloc[np.flatnonzero(self._contains_mask(df, 'title', query))]
     
     def get_director_movies(self, df, director):
         """Get movies by a specific director"""
         if 'director' not in df.columns:
             return pd.DataFrame()
         
-        return df[df['director'].str.contains(director, case=False, na=False)]
+        return df.iloc[np.flatnonzero(self._contains_mask(df, 'director', director))]
     
     def get_decade_analysis(self, df):
         """Analyze movies by decade"""
-        df = df.copy()
-        df['decade'] = (df['release_year'] // 10) * 10
+        # Group by a throwaway decade array instead of adding a column to a copy
+        decade = pd.Index((df['release_year'].to_numpy() // 10) * 10, name='decade')
         
-        decade_stats = df.groupby('decade').agg({
+        decade_stats = df.groupby(decade).agg({
             'movie_id': 'count',
             'vote_average': 'mean',
             'runtime': 'mean',
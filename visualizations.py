@@ -1,10 +1,148 @@
+import plotly
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 import seaborn as sns
-from collections import Counter
+import contextvars
+import functools
+import hashlib
+import operator
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum number of points sent to the browser per scatter plot
+MAX_SCATTER_POINTS = 4000
+
+# Numeric features kept as plain numpy arrays for the full dataset
+NUMERIC_COLUMNS = ['vote_average', 'vote_count', 'runtime', 'budget', 'revenue', 'popularity']
+
+# Maximum number of memoized aggregations kept per MovieVisualizations instance
+MAX_CACHE_ENTRIES = 64
+
+# Serialized figures persisted across sessions and restarts
+FIGURE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'filminsight')
+MAX_CACHED_FIGURES = 500
+
+# The frame being drawn by the current disk-cached plot call and its digest, shared with _memo
+_current_frame = contextvars.ContextVar('current_frame', default=None)
+
+
+def _frame_digest(df):
+    """Hash the contents of a frame and its index, covering every column the plots read"""
+    hashable = [col for col in df.columns if df[col].dtype != object or col == 'title']
+    hashed = df[hashable]
+    if 'genre_list' in df.columns:
+        # Lists cannot be hashed, tuples of the same genres can
+        hashed = hashed.assign(genre_list=df['genre_list'].map(tuple, na_action='ignore'))
+    # Hash the row hashes in order, since row order decides ties in the rankings
+    row_hashes = pd.util.hash_pandas_object(hashed).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def _prune_figure_cache():
+    """Keep only the most recently written figures on disk"""
+    # Temporary files belong to writers still in progress
+    paths = [
+        os.path.join(FIGURE_CACHE_DIR, name)
+        for name in os.listdir(FIGURE_CACHE_DIR) if name.endswith('.json')
+    ]
+    if len(paths) <= MAX_CACHED_FIGURES:
+        return
+    paths.sort(key=os.path.getmtime)
+    for path in paths[:len(paths) - MAX_CACHED_FIGURES]:
+        os.remove(path)
+
+
+def disk_cached(method):
+    """Cache a plot method's figure as JSON on disk, keyed by its inputs, plotly and this module"""
+    # Loading a figure costs a digest plus plotly validation (~8 ms), so only wrap
+    # plots that take longer than that to build
+    @functools.wraps(method)
+    def wrapper(self, df, *args):
+        source = os.path.abspath(__file__)
+        digest = _frame_digest(df)
+        key_source = '|'.join([
+            method.__name__,
+            repr(args),
+            str(len(df)),
+            digest,
+            plotly.__version__,
+            f"{os.path.getmtime(source)}{os.path.getsize(source)}"
+        ])
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        path = os.path.join(FIGURE_CACHE_DIR, f"{key}.json")
+        
+        try:
+            with open(path) as f:
+                return pio.from_json(f.read())
+        except (OSError, ValueError):
+            pass
+        
+        token = _current_frame.set((df, digest))
+        try:
+            fig = method(self, df, *args)
+        finally:
+            _current_frame.reset(token)
+        try:
+            os.makedirs(FIGURE_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=FIGURE_CACHE_DIR, suffix='.tmp')
+        except OSError:
+            return fig
+        
+        # Write then rename, so other sessions never read a half-written figure
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(pio.to_json(fig))
+            os.replace(tmp_path, path)
+            _prune_figure_cache()
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return fig
+    
+    return wrapper
+
+
+def _lttb_indices(x, y, n_out):
+    """Select n_out visually significant point indices with Largest-Triangle-Three-Buckets"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    order = np.argsort(x, kind='stable')
+    xs = x[order].astype(float)
+    ys = y[order].astype(float)
+    
+    # First and last points are always kept; the rest are split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xs[next_start:next_end].mean()
+        avg_y = ys[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and next bucket average
+        areas = np.abs(
+            (xs[prev] - avg_x) * (ys[start:end] - ys[prev]) -
+            (xs[prev] - xs[start:end]) * (avg_y - ys[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+    
+    return np.sort(order[selected])
+
 
 class MovieVisualizations:
     """Class to handle all movie data visualizations"""
@@ -16,121 +154,121 @@ class MovieVisualizations:
             '#f0932b', '#eb4d4b', '#6ab04c', '#be2edd'
         ]
         self.template = 'plotly_dark'
-    
-    def plot_rating_distribution(self, df):
-        """Plot distribution of movie ratings"""
-        fig = px.histogram(
-            df, 
-            x='vote_average', 
-            nbins=30,
-            title='Distribution of Movie Ratings',
-            labels={'vote_average': 'Vote Average', 'count': 'Number of Movies'},
-            color_discrete_sequence=['#ff6b6b']
-        )
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cols = {col: df[col].to_numpy() for col in NUMERIC_COLUMNS if col in df.columns}
         
-        fig.update_layout(
+        # Shared layouts, validated once; each plot only adds its own titles
+        title_style = {'x': 0.5, 'xanchor': 'center', 'font_size': 16}
+        self._hist_proto = go.Layout(
             template=self.template,
-            title={
-                'text': 'Distribution of Movie Ratings',
-                'x': 0.5,
-                'xanchor': 'center',
-                'font_size': 16
-            },
+            title=title_style,
+            yaxis_title='Number of Movies',
+            bargap=0,
             showlegend=False
         )
+        self._line_proto = go.Layout(template=self.template, title=title_style)
         
-        return fig
+        if 'genre_list' in df.columns:
+            self._genre_cats, self._genre_codes, self._genre_row_ends = self._pack_genres(df)
+    
+    def clear_cache(self):
+        """Drop all memoized aggregations"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _column_array(self, df, col):
+        """Numpy values of a column, reusing the precomputed arrays for the full dataset"""
+        if df is self.df and col in self._cols:
+            return self._cols[col]
+        return df[col].to_numpy()
+    
+    def _memo(self, name, df, fn):
+        """Return fn() for this frame, reusing the result computed for an identical frame"""
+        # Only the enclosing disk-cached call has already paid for the frame's digest
+        current = _current_frame.get()
+        if current is None or current[0] is not df:
+            return fn()
+        
+        key = (name, len(df), tuple(df.columns), current[1])
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        result = fn()
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > MAX_CACHE_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+    
+    def render_all(self, df, methods):
+        """Build several single-frame plots concurrently, returned as {method name: figure}"""
+        if not methods:
+            return {}
+        workers = min(len(methods), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            figures = executor.map(lambda name: getattr(self, name)(df), methods)
+            return dict(zip(methods, figures))
+    
+    def plot_rating_distribution(self, df):
+        """Plot distribution of movie ratings"""
+        return self._histogram(
+            self._column_array(df, 'vote_average'),
+            title='Distribution of Movie Ratings',
+            x_label='Vote Average',
+            color='#ff6b6b',
+            bin_size=0.5,
+            step=0.1
+        )
     
     def plot_runtime_distribution(self, df):
         """Plot distribution of movie runtimes"""
-        fig = px.histogram(
-            df, 
-            x='runtime', 
-            nbins=30,
+        return self._histogram(
+            self._column_array(df, 'runtime'),
             title='Distribution of Movie Runtimes',
-            labels={'runtime': 'Runtime (minutes)', 'count': 'Number of Movies'},
-            color_discrete_sequence=['#4ecdc4']
+            x_label='Runtime (minutes)',
+            color='#4ecdc4',
+            bin_size=10,
+            step=1
         )
-        
-        fig.update_layout(
-            template=self.template,
-            title={
-                'text': 'Distribution of Movie Runtimes',
-                'x': 0.5,
-                'xanchor': 'center',
-                'font_size': 16
-            },
-            showlegend=False
-        )
-        
-        return fig
     
     def plot_movies_per_year(self, df):
         """Plot number of movies released per year"""
         yearly_counts = df.groupby('release_year').size().reset_index(name='count')
         
-        fig = px.line(
-            yearly_counts,
-            x='release_year',
-            y='count',
-            title='Number of Movies Released Per Year',
-            labels={'release_year': 'Year', 'count': 'Number of Movies'},
-            line_shape='spline'
+        return self._line_chart(
+            yearly_counts['release_year'],
+            yearly_counts['count'],
+            'Number of Movies Released Per Year',
+            'Year',
+            'Number of Movies',
+            '#45b7d1'
         )
-        
-        fig.update_traces(line_color='#45b7d1', line_width=3)
-        fig.update_layout(
-            template=self.template,
-            title={
-                'text': 'Number of Movies Released Per Year',
-                'x': 0.5,
-                'xanchor': 'center',
-                'font_size': 16
-            }
-        )
-        
-        return fig
     
     def plot_rating_by_year(self, df):
         """Plot average rating by year"""
         yearly_ratings = df.groupby('release_year')['vote_average'].mean().reset_index()
         
-        fig = px.line(
-            yearly_ratings,
-            x='release_year',
-            y='vote_average',
-            title='Average Movie Rating by Year',
-            labels={'release_year': 'Year', 'vote_average': 'Average Rating'},
-            line_shape='spline'
-        )
-        
-        fig.update_traces(line_color='#f9ca24', line_width=3)
-        fig.update_layout(
-            template=self.template,
-            title={
-                'text': 'Average Movie Rating by Year',
-                'x': 0.5,
-                'xanchor': 'center',
-                'font_size': 16
-            }
+        return self._line_chart(
+            yearly_ratings['release_year'],
+            yearly_ratings['vote_average'],
+            'Average Movie Rating by Year',
+            'Year',
+            'Average Rating',
+            '#f9ca24'
         )
-        
-        return fig
     
+    @disk_cached
     def plot_genre_distribution(self, df):
         """Plot distribution of genres"""
         if 'genre_list' not in df.columns:
             return self._empty_plot("Genre data not available")
         
         # Count all genres
-        all_genres = []
-        for genres in df['genre_list']:
-            all_genres.extend(genres)
-        
-        genre_counts = Counter(all_genres)
-        top_genres = dict(genre_counts.most_common(15))
-        
-        genre_df = pd.DataFrame(list(top_genres.items()), columns=['Genre', 'Count'])
+        genre_counts = self._count_genres(df).head(15)
+        genre_df = genre_counts.rename_axis('Genre').reset_index(name='Count')
         
         fig = px.bar(
             genre_df,
@@ -156,28 +294,22 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_genre_ratings(self, df):
         """Plot average ratings by genre"""
         if 'genre_list' not in df.columns:
             return self._empty_plot("Genre data not available")
         
-        # Expand genres for analysis
-        genre_data = []
-        for _, row in df.iterrows():
-            for genre in row['genre_list']:
-                genre_data.append({
-                    'genre': genre,
-                    'vote_average': row['vote_average'],
-                    'vote_count': row['vote_count']
-                })
-        
-        genre_df = pd.DataFrame(genre_data)
+        # Expand genres into one row per (movie, genre) pair
+        genre_df = self._explode_genres(df)[['genre_list', 'vote_average', 'vote_count']].rename(
+            columns={'genre_list': 'genre'}
+        )
         
         # Calculate weighted average ratings
-        genre_ratings = genre_df.groupby('genre').agg({
-            'vote_average': 'mean',
-            'vote_count': 'sum'
-        }).reset_index()
+        genre_ratings = genre_df.groupby('genre', sort=False).agg(
+            vote_average=('vote_average', 'mean'),
+            vote_count=('vote_count', 'sum')
+        ).reset_index()
         
         # Filter genres with at least 10 movies
         genre_ratings = genre_ratings[genre_ratings['vote_count'] >= 10]
@@ -207,31 +339,29 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_genre_trends(self, df):
         """Plot genre popularity trends over time"""
         if 'genre_list' not in df.columns:
             return self._empty_plot("Genre data not available")
         
+        exploded = self._explode_genres(df)
+        
         # Get top 6 genres
-        all_genres = []
-        for genres in df['genre_list']:
-            all_genres.extend(genres)
-        
-        top_genres = [genre for genre, _ in Counter(all_genres).most_common(6)]
-        
-        # Prepare data for time series
-        trend_data = []
-        for year in sorted(df['release_year'].unique()):
-            year_movies = df[df['release_year'] == year]
-            for genre in top_genres:
-                count = sum(1 for genres in year_movies['genre_list'] if genre in genres)
-                trend_data.append({
-                    'year': year,
-                    'genre': genre,
-                    'count': count
-                })
-        
-        trend_df = pd.DataFrame(trend_data)
+        top_genres = self._count_genres(df).head(6).index.tolist()
+        
+        # Factorize years and genres to integer codes and count every pair with one bincount
+        years = np.unique(df['release_year'].to_numpy())
+        genre_idx = pd.Index(top_genres).get_indexer(exploded['genre_list'])
+        is_top = genre_idx >= 0
+        year_idx = np.searchsorted(years, exploded['release_year'].to_numpy()[is_top])
+        counts = np.bincount(
+            year_idx * len(top_genres) + genre_idx[is_top],
+            minlength=len(years) * len(top_genres)
+        ).reshape(len(years), len(top_genres))
+        
+        trend_df = pd.DataFrame(counts, index=pd.Index(years, name='year'), columns=top_genres)
+        trend_df = trend_df.reset_index().melt(id_vars='year', var_name='genre', value_name='count')
         
         fig = px.line(
             trend_df,
@@ -256,21 +386,36 @@ class MovieVisualizations:
     
     def plot_correlation_heatmap(self, df):
         """Plot correlation heatmap of numeric variables"""
-        numeric_cols = ['vote_average', 'vote_count', 'runtime', 'budget', 'revenue', 'popularity']
-        available_cols = [col for col in numeric_cols if col in df.columns]
+        available_cols = [col for col in NUMERIC_COLUMNS if col in df.columns]
         
         if len(available_cols) < 2:
             return self._empty_plot("Insufficient numeric data for correlation")
-        
-        corr_matrix = df[available_cols].corr()
+        if len(df) < 2:
+            return self._empty_plot("At least two movies are needed for correlation")
+        
+        # One contiguous float32 (features x movies) block halves the memory traffic
+        features = np.stack(
+            [self._column_array(df, col) for col in available_cols]
+        ).astype(np.float32)
+        
+        # Constant columns have no defined correlation; leave them as NaN like DataFrame.corr
+        with np.errstate(divide='ignore', invalid='ignore'):
+            missing = np.isnan(features)
+            if missing.any():
+                # Impute gaps with the feature mean so one NaN does not blank a whole row;
+                # an all-NaN feature divides 0 by 0 here, which errstate silences, unlike np.nanmean
+                totals = np.where(missing, 0, features).sum(axis=1, keepdims=True)
+                means = totals / (~missing).sum(axis=1, keepdims=True)
+                features = np.where(missing, means, features)
+            corr_matrix = np.corrcoef(features, dtype=np.float32).astype(np.float64)
         
         fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
+            z=corr_matrix,
+            x=available_cols,
+            y=available_cols,
             colorscale='RdBu',
             zmid=0,
-            text=np.around(corr_matrix.values, decimals=2),
+            text=np.around(corr_matrix, decimals=2),
             texttemplate='%{text}',
             textfont={"size": 10},
             hoverongaps=False
@@ -290,8 +435,11 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_runtime_vs_rating(self, df):
         """Plot runtime vs rating scatter plot"""
+        df = self._downsample_scatter(df, 'runtime', 'vote_average')
+        
         fig = px.scatter(
             df,
             x='runtime',
@@ -302,7 +450,8 @@ class MovieVisualizations:
             color='vote_count',
             size='popularity',
             hover_data=['title'],
-            color_continuous_scale='Viridis'
+            color_continuous_scale='Viridis',
+            render_mode='webgl'
         )
         
         fig.update_layout(
@@ -317,8 +466,11 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_votes_vs_rating(self, df):
         """Plot vote count vs rating scatter plot"""
+        df = self._downsample_scatter(df, 'vote_count', 'vote_average')
+        
         fig = px.scatter(
             df,
             x='vote_count',
@@ -329,7 +481,8 @@ class MovieVisualizations:
             color='popularity',
             size='revenue',
             hover_data=['title'],
-            color_continuous_scale='Plasma'
+            color_continuous_scale='Plasma',
+            render_mode='webgl'
         )
         
         fig.update_layout(
@@ -344,9 +497,10 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_top_movies_bar(self, df, metric_col, title):
         """Generic function to plot top movies bar chart"""
-        df_sorted = df.head(10)
+        df_sorted = self._top_k(df, metric_col, 10)
         
         fig = px.bar(
             df_sorted,
@@ -372,10 +526,11 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_long_movies(self, df):
         """Plot movies with runtime >= 180 minutes"""
         fig = px.bar(
-            df.head(15),
+            self._top_k(df, 'runtime', 15),
             x='runtime',
             y='title',
             orientation='h',
@@ -398,10 +553,22 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_budget_vs_revenue(self, df):
         """Plot budget vs revenue scatter plot"""
+        budget = self._column_array(df, 'budget')
+        revenue = self._column_array(df, 'revenue')
+        
         # Filter out zero values for better visualization
-        plot_df = df[(df['budget'] > 0) & (df['revenue'] > 0)]
+        positions = np.flatnonzero((budget > 0) & (revenue > 0))
+        
+        # Break-even line spans the full data range, not just the sampled points
+        max_val = max(budget[positions].max(), revenue[positions].max()) if len(positions) else 0
+        if len(positions) > MAX_SCATTER_POINTS:
+            positions = positions[_lttb_indices(budget[positions], revenue[positions], MAX_SCATTER_POINTS)]
+        
+        # Only the plotted rows are materialized as a DataFrame, for hover data
+        plot_df = df.iloc[positions]
         
         fig = px.scatter(
             plot_df,
@@ -413,12 +580,12 @@ class MovieVisualizations:
             color='vote_average',
             size='popularity',
             hover_data=['title'],
-            color_continuous_scale='RdYlGn'
+            color_continuous_scale='RdYlGn',
+            render_mode='webgl'
         )
         
         # Add diagonal line for break-even
-        max_val = max(plot_df['budget'].max(), plot_df['revenue'].max())
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=[0, max_val],
             y=[0, max_val],
             mode='lines',
@@ -438,14 +605,18 @@ class MovieVisualizations:
         
         return fig
     
+    @disk_cached
     def plot_profit_analysis(self, df):
         """Plot profit analysis"""
         if 'profit' not in df.columns:
             return self._empty_plot("Profit data not available")
         
         # Filter movies with budget and revenue data
-        profit_df = df[(df['budget'] > 0) & (df['revenue'] > 0)].copy()
-        profit_df = profit_df.sort_values('profit', ascending=False).head(15)
+        budget = self._column_array(df, 'budget')
+        revenue = self._column_array(df, 'revenue')
+        positions = np.flatnonzero((budget > 0) & (revenue > 0))
+        
+        profit_df = self._top_k(df.iloc[positions], 'profit', 15)
         
         fig = px.bar(
             profit_df,
@@ -471,6 +642,113 @@ class MovieVisualizations:
         
         return fig
     
+    def _explode_genres(self, df):
+        """One row per (movie, genre) pair, shared by all genre plots for the same frame"""
+        def explode():
+            columns = [col for col in ('release_year', 'genre_list', 'vote_average', 'vote_count') if col in df.columns]
+            return df[columns].explode('genre_list')
+        
+        return self._memo('exploded_genres', df, explode)
+    
+    def _pack_genres(self, df):
+        """Genre vocabulary as a CategoricalDtype, every (movie, genre) pair as int16 codes and each movie's end offset"""
+        genre_lists = [genres if isinstance(genres, list) else [] for genres in df['genre_list']]
+        flat = [genre for genres in genre_lists for genre in genres]
+        cats = pd.CategoricalDtype(sorted(set(flat)))
+        codes = pd.Categorical(flat, dtype=cats).codes.astype(np.int16)
+        row_ends = np.cumsum(np.fromiter(map(len, genre_lists), dtype=np.intp, count=len(genre_lists)))
+        return cats, codes, row_ends
+    
+    def _genre_rows(self, df):
+        """Positions of df's rows in the base frame, or None if df is not a subset of its rows"""
+        if df is self.df:
+            return np.arange(len(df))
+        if 'genre_list' not in self.df.columns or not self.df.index.is_unique:
+            return None
+        
+        positions = self.df.index.get_indexer(df.index)
+        if (positions < 0).any():
+            return None
+        
+        # Filtered frames share the base frame's list objects; a frame that only shares labels does not
+        base_lists = self.df['genre_list'].to_numpy()[positions]
+        if not all(map(operator.is_, base_lists, df['genre_list'].to_numpy())):
+            return None
+        return positions
+    
+    def _count_genres(self, df):
+        """Count genres in a frame, most common first"""
+        positions = self._genre_rows(df)
+        if positions is None:
+            cats, codes, _ = self._pack_genres(df)
+        else:
+            # Gather the selected movies' slices of the packed base codes in one step
+            cats = self._genre_cats
+            row_starts = np.concatenate(([0], self._genre_row_ends[:-1]))
+            starts = row_starts[positions]
+            lengths = self._genre_row_ends[positions] - starts
+            offsets = np.cumsum(lengths) - lengths
+            codes = self._genre_codes[np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())]
+        
+        counts = np.bincount(codes, minlength=len(cats.categories))
+        
+        # Ties keep first-seen order, matching Counter.most_common
+        present, first_seen = np.unique(codes, return_index=True)
+        order = present[np.lexsort((first_seen, -counts[present]))]
+        return pd.Series(counts[order], index=cats.categories[order])
+    
+    def _downsample_scatter(self, df, x_col, y_col):
+        """Reduce a scatter plot's rows to at most MAX_SCATTER_POINTS using LTTB"""
+        if len(df) <= MAX_SCATTER_POINTS:
+            return df
+        
+        idx = _lttb_indices(df[x_col].to_numpy(), df[y_col].to_numpy(), MAX_SCATTER_POINTS)
+        return df.iloc[idx]
+    
+    def _top_k(self, df, col, k):
+        """Rows with the k largest values of col, largest first, without sorting the whole frame"""
+        if len(df) > k:
+            values = df[col].to_numpy()
+            df = df.iloc[np.argpartition(-values, k)[:k]]
+        return df.sort_values(col, ascending=False, kind='stable')
+    
+    def _histogram(self, values, title, x_label, color, bin_size, step):
+        """Bar chart of precomputed histogram bins, so only the bin counts reach the browser"""
+        # Bins span whole multiples of the data's step, with edges halfway between
+        # possible values, so every bin covers the same number of them
+        lo = float(np.floor(values.min() / bin_size) * bin_size) if len(values) else 0.0
+        hi = float(values.max()) if len(values) else 0.0
+        n_bins = int((hi - lo + step / 2) // bin_size) + 1
+        edges = lo - step / 2 + bin_size * np.arange(n_bins + 1)
+        counts, edges = np.histogram(values, bins=edges)
+        centers = (edges[:-1] + edges[1:]) / 2
+        decimals = max(0, -int(np.floor(np.log10(step))))
+        
+        fig = go.Figure(go.Bar(
+            x=centers,
+            y=counts,
+            width=bin_size,
+            marker_color=color,
+            customdata=np.round(np.column_stack([edges[:-1] + step / 2, edges[1:] - step / 2]), decimals),
+            hovertemplate=f'%{{customdata[0]:.{decimals}f}} - %{{customdata[1]:.{decimals}f}}<br>Movies: %{{y}}<extra></extra>'
+        ), layout=self._hist_proto)
+        fig.update_layout(title_text=title, xaxis_title=x_label)
+        
+        return fig
+    
+    def _line_chart(self, x, y, title, x_label, y_label, color):
+        """Smoothed single-series line chart on the shared line layout"""
+        fig = go.Figure(go.Scatter(
+            x=x,
+            y=y,
+            mode='lines',
+            line={'color': color, 'width': 3, 'shape': 'spline'},
+            hovertemplate=f'{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>'
+        ), layout=self._line_proto)
+        fig.update_layout(title_text=title, xaxis_title=x_label, yaxis_title=y_label)
+        
+        return fig
+    
     def _empty_plot(self, message):
         """Create an empty plot with a message"""
         fig = go.Figure()